@@ -12,10 +12,12 @@
 # from ankimorphs import browser_utils
 ################################################################
 
+from __future__ import annotations
+
 import json
 from functools import partial
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Literal
 
 import aqt
 from anki.cards import Card
@@ -49,13 +51,7 @@ from . import (
 from .ankimorphs_config import AnkiMorphsConfig, AnkiMorphsConfigFilter
 from .ankimorphs_db import AnkiMorphsDB
 from .extra_settings import ankimorphs_extra_settings, extra_settings_keys
-from .generators.generators_window import GeneratorWindow
-from .known_morphs_exporter import KnownMorphsExporterDialog
-from .progression.progression_window import ProgressionWindow
 from .recalc import recalc_main
-from .settings import settings_dialog
-from .settings.settings_dialog import SettingsDialog
-from .tag_selection_dialog import TagSelectionDialog
 from .toolbar_stats import MorphToolbarStats
 
 _TOOL_MENU: str = "am_tool_menu"
@@ -64,6 +60,7 @@ _CONTEXT_MENU: str = "am_context_menu"
 
 _startup_sync: bool = True
 _updated_seen_morphs_for_profile: bool = False
+_cached_am_config: AnkiMorphsConfig | None = None
 
 
 def main() -> None:
@@ -72,14 +69,7 @@ def main() -> None:
 
     gui_hooks.top_toolbar_did_init_links.append(init_toolbar_items)
 
-    gui_hooks.profile_did_open.append(load_am_profile_configs)
-    gui_hooks.profile_did_open.append(init_db)
-    gui_hooks.profile_did_open.append(create_am_directories_and_files)
-    gui_hooks.profile_did_open.append(register_addon_dialogs)
-    gui_hooks.profile_did_open.append(redraw_toolbar)
-    gui_hooks.profile_did_open.append(init_tool_menu_and_actions)
-    gui_hooks.profile_did_open.append(init_browser_menus_and_actions)
-    gui_hooks.profile_did_open.append(replace_reviewer_functions)
+    gui_hooks.profile_did_open.append(init_profile_session)
 
     gui_hooks.sync_will_start.append(recalc_on_sync)
 
@@ -95,10 +85,20 @@ def main() -> None:
     gui_hooks.profile_will_close.append(cleanup_profile_session)
 
 
+def _get_am_config() -> AnkiMorphsConfig:
+    # The menu initializers all run on profile-open, so they can share
+    # one config instance instead of re-reading the config json each time.
+    # The cache is cleared on profile close.
+    global _cached_am_config
+
+    if _cached_am_config is None:
+        _cached_am_config = AnkiMorphsConfig()
+    return _cached_am_config
+
+
 def init_toolbar_items(links: list[str], toolbar: Toolbar) -> None:
     # Adds the 'L: I:' and 'Recalc' to the toolbar
 
-    morph_toolbar_stats = MorphToolbarStats()
     am_config = AnkiMorphsConfig()
 
     known_morphs_tooltip_message = (
@@ -116,6 +116,12 @@ def init_toolbar_items(links: list[str], toolbar: Toolbar) -> None:
             )
         )
 
+    if am_config.hide_lemma_toolbar and am_config.hide_inflection_toolbar:
+        # skip querying the database when the stats are never displayed
+        return
+
+    morph_toolbar_stats = MorphToolbarStats()
+
     if am_config.hide_lemma_toolbar is False:
         links.append(
             toolbar.create_link(
@@ -139,6 +145,19 @@ def init_toolbar_items(links: list[str], toolbar: Toolbar) -> None:
         )
 
 
+def init_profile_session() -> None:
+    # One dispatcher instead of eight separate profile_did_open hooks;
+    # the init functions run in the same order as before.
+    load_am_profile_configs()
+    init_db()
+    create_am_directories_and_files()
+    register_addon_dialogs()
+    redraw_toolbar()
+    init_tool_menu_and_actions()
+    init_browser_menus_and_actions()
+    replace_reviewer_functions()
+
+
 def load_am_profile_configs() -> None:
     assert mw is not None
 
@@ -175,19 +194,26 @@ def create_am_directories_and_files() -> None:
         mw.pm.profileFolder(), am_globals.PRIORITY_FILES_DIR_NAME
     )
 
-    # Create the file if it doesn't exist
+    # Create the file and directories if they don't exist; letting
+    # mkdir handle the existence check avoids a separate stat call
     names_file_path.touch(exist_ok=True)
-
-    if not known_morphs_dir_path.exists():
-        Path(known_morphs_dir_path).mkdir()
-
-    if not priority_files_dir_path.exists():
-        Path(priority_files_dir_path).mkdir()
+    known_morphs_dir_path.mkdir(exist_ok=True)
+    priority_files_dir_path.mkdir(exist_ok=True)
 
 
 def register_addon_dialogs() -> None:
     # We use the Anki dialog manager to handle our dialogs
 
+    # the dialogs pull in heavy Qt window modules, so they are imported
+    # here instead of at the top of the file to keep add-on load cheap
+    # pylint:disable=import-outside-toplevel
+    from .generators.generators_window import GeneratorWindow
+    from .known_morphs_exporter import KnownMorphsExporterDialog
+    from .progression.progression_window import ProgressionWindow
+    from .settings.settings_dialog import SettingsDialog
+
+    # pylint:enable=import-outside-toplevel
+
     aqt.dialogs.register_dialog(
         name=am_globals.SETTINGS_DIALOG_NAME, creator=SettingsDialog
     )
@@ -219,43 +245,90 @@ def init_tool_menu_and_actions() -> None:
         if action.objectName() == _TOOL_MENU:
             return  # prevents duplicate menus on profile-switch
 
-    am_config = AnkiMorphsConfig()
+    am_config = _get_am_config()
+
+    # (title, callback, shortcut) triples, in menu order
+    tool_menu_actions: list[tuple[str, Callable[[], None], QKeySequence | None]] = [
+        (
+            "&Settings",
+            partial(aqt.dialogs.open, name=am_globals.SETTINGS_DIALOG_NAME),
+            am_config.shortcut_settings,
+        ),
+        ("&Recalc", recalc_main.recalc, am_config.shortcut_recalc),
+        (
+            "&Generators",
+            partial(aqt.dialogs.open, name=am_globals.GENERATOR_DIALOG_NAME),
+            am_config.shortcut_generators,
+        ),
+        (
+            "&Progression",
+            partial(aqt.dialogs.open, name=am_globals.PROGRESSION_DIALOG_NAME),
+            am_config.shortcut_progression,
+        ),
+        (
+            "&Known Morphs Exporter",
+            partial(
+                aqt.dialogs.open, name=am_globals.KNOWN_MORPHS_EXPORTER_DIALOG_NAME
+            ),
+            am_config.shortcut_known_morphs_exporter,
+        ),
+        ("&Reset Tags", reset_am_tags, None),
+        (
+            "&Guide (web)",
+            partial(
+                _open_url,
+                "https://mortii.github.io/anki-morphs/user_guide/intro.html",
+            ),
+            None,
+        ),
+        (
+            "&Changelog (web)",
+            partial(_open_url, "https://github.com/mortii/anki-morphs/releases"),
+            None,
+        ),
+    ]
 
-    settings_action = create_settings_action(am_config)
-    recalc_action = create_recalc_action(am_config)
-    generators_action = create_generators_dialog_action(am_config)
-    progression_action = create_progression_dialog_action(am_config)
-    known_morphs_exporter_action = create_known_morphs_exporter_action(am_config)
-    reset_tags_action = create_tag_reset_action()
-    guide_action = create_guide_action()
-    changelog_action = create_changelog_action()
+    if am_globals.DEV_MODE:
+        tool_menu_actions.append(("&Test", test_function, QKeySequence("Ctrl+T")))
 
     am_tool_menu = create_am_tool_menu()
-    am_tool_menu.addAction(settings_action)
-    am_tool_menu.addAction(recalc_action)
-    am_tool_menu.addAction(generators_action)
-    am_tool_menu.addAction(progression_action)
-    am_tool_menu.addAction(known_morphs_exporter_action)
-    am_tool_menu.addAction(reset_tags_action)
-    am_tool_menu.addAction(guide_action)
-    am_tool_menu.addAction(changelog_action)
-
-    if am_globals.DEV_MODE:
-        test_action = create_test_action()
-        am_tool_menu.addAction(test_action)
+    for title, callback, shortcut in tool_menu_actions:
+        am_tool_menu.addAction(create_action(title, callback, shortcut))
 
 
 def init_browser_menus_and_actions() -> None:
-    am_config = AnkiMorphsConfig()
+    am_config = _get_am_config()
 
-    view_action = create_view_morphs_action(am_config)
-    learn_now_action = create_learn_now_action(am_config)
-    browse_morph_action = create_browse_same_morph_action()
-    browse_morph_unknowns_action = create_browse_same_morph_unknowns_action(am_config)
-    browse_morph_unknowns_lemma_action = create_browse_same_morph_unknowns_lemma_action(
-        am_config
+    view_action = create_action(
+        "&View Morphemes",
+        browser_utils.run_view_morphs,
+        am_config.shortcut_view_morphemes,
+    )
+    learn_now_action = create_action(
+        "&Learn Card Now",
+        browser_utils.run_learn_card_now,
+        am_config.shortcut_learn_now,
+    )
+    browse_morph_action = create_action(
+        "&Browse Same Morphs", browser_utils.run_browse_morph
+    )
+    browse_morph_unknowns_action = create_action(
+        "&Browse Same Unknown Morphs",
+        partial(browser_utils.run_browse_morph, search_unknowns=True),
+        am_config.shortcut_browse_ready_same_unknown,
+    )
+    browse_morph_unknowns_lemma_action = create_action(
+        "&Browse Same Unknown Morphs (Lemma)",
+        partial(
+            browser_utils.run_browse_morph, search_unknowns=True, search_lemma_only=True
+        ),
+        am_config.shortcut_browse_ready_same_unknown_lemma,
+    )
+    already_known_tagger_action = create_action(
+        "&Tag As Known",
+        browser_utils.run_already_known_tagger,
+        am_config.shortcut_set_known_and_skip,
     )
-    already_known_tagger_action = create_already_known_tagger_action(am_config)
 
     def setup_browser_menu(_browser: Browser) -> None:
         browser_utils.browser = _browser
@@ -400,7 +473,9 @@ def rebuild_seen_morphs(_changes: OpChangesAfterUndo) -> None:
 
 def cleanup_profile_session() -> None:
     global _updated_seen_morphs_for_profile
+    global _cached_am_config
     _updated_seen_morphs_for_profile = False
+    _cached_am_config = None
     AnkiMorphsDB.drop_seen_morphs_table()
 
 
@@ -431,97 +506,20 @@ def create_am_tool_menu() -> QMenu:
     return am_tool_menu
 
 
-def create_recalc_action(am_config: AnkiMorphsConfig) -> QAction:
-    action = QAction("&Recalc", mw)
-    action.setShortcut(am_config.shortcut_recalc)
-    action.triggered.connect(recalc_main.recalc)
-    return action
-
-
-def create_settings_action(am_config: AnkiMorphsConfig) -> QAction:
-    action = QAction("&Settings", mw)
-    action.setShortcut(am_config.shortcut_settings)
-    action.triggered.connect(
-        partial(aqt.dialogs.open, name=am_globals.SETTINGS_DIALOG_NAME)
-    )
-    return action
-
-
-def create_tag_reset_action() -> QAction:
-    action = QAction("&Reset Tags", mw)
-    action.triggered.connect(reset_am_tags)
-    return action
-
-
-def create_guide_action() -> QAction:
-    desktop_service = QDesktopServices()
-    action = QAction("&Guide (web)", mw)
-    action.triggered.connect(
-        lambda: desktop_service.openUrl(
-            QUrl("https://mortii.github.io/anki-morphs/user_guide/intro.html")
-        )
-    )
-    return action
-
-
-def create_changelog_action() -> QAction:
-    desktop_service = QDesktopServices()
-    action = QAction("&Changelog (web)", mw)
-    action.triggered.connect(
-        lambda: desktop_service.openUrl(
-            QUrl("https://github.com/mortii/anki-morphs/releases")
-        )
-    )
-    return action
-
-
-def create_learn_now_action(am_config: AnkiMorphsConfig) -> QAction:
-    action = QAction("&Learn Card Now", mw)
-    action.setShortcut(am_config.shortcut_learn_now)
-    action.triggered.connect(browser_utils.run_learn_card_now)
-    return action
-
-
-def create_browse_same_morph_action() -> QAction:
-    action = QAction("&Browse Same Morphs", mw)
-    action.triggered.connect(browser_utils.run_browse_morph)
-    return action
-
-
-def create_browse_same_morph_unknowns_action(am_config: AnkiMorphsConfig) -> QAction:
-    action = QAction("&Browse Same Unknown Morphs", mw)
-    action.setShortcut(am_config.shortcut_browse_ready_same_unknown)
-    action.triggered.connect(
-        partial(browser_utils.run_browse_morph, search_unknowns=True)
-    )
-    return action
-
-
-def create_browse_same_morph_unknowns_lemma_action(
-    am_config: AnkiMorphsConfig,
+def create_action(
+    title: str,
+    callback: Callable[[], None],
+    shortcut: QKeySequence | None = None,
 ) -> QAction:
-    action = QAction("&Browse Same Unknown Morphs (Lemma)", mw)
-    action.setShortcut(am_config.shortcut_browse_ready_same_unknown_lemma)
-    action.triggered.connect(
-        partial(
-            browser_utils.run_browse_morph, search_unknowns=True, search_lemma_only=True
-        )
-    )
-    return action
-
-
-def create_view_morphs_action(am_config: AnkiMorphsConfig) -> QAction:
-    action = QAction("&View Morphemes", mw)
-    action.setShortcut(am_config.shortcut_view_morphemes)
-    action.triggered.connect(browser_utils.run_view_morphs)
+    action = QAction(title, mw)
+    if shortcut is not None:
+        action.setShortcut(shortcut)
+    action.triggered.connect(callback)
     return action
 
 
-def create_already_known_tagger_action(am_config: AnkiMorphsConfig) -> QAction:
-    action = QAction("&Tag As Known", mw)
-    action.setShortcut(am_config.shortcut_set_known_and_skip)
-    action.triggered.connect(browser_utils.run_already_known_tagger)
-    return action
+def _open_url(url: str) -> None:
+    QDesktopServices.openUrl(QUrl(url))
 
 
 def add_text_as_name_action(web_view: AnkiWebView, menu: QMenu) -> None:
@@ -547,50 +545,6 @@ def browse_study_morphs_for_text_action(web_view: AnkiWebView, menu: QMenu) -> N
     menu.addAction(action)
 
 
-def create_generators_dialog_action(am_config: AnkiMorphsConfig) -> QAction:
-    action = QAction("&Generators", mw)
-    action.setShortcut(am_config.shortcut_generators)
-    action.triggered.connect(
-        partial(
-            aqt.dialogs.open,
-            name=am_globals.GENERATOR_DIALOG_NAME,
-        )
-    )
-    return action
-
-
-def create_progression_dialog_action(am_config: AnkiMorphsConfig) -> QAction:
-    action = QAction("&Progression", mw)
-    action.setShortcut(am_config.shortcut_progression)
-    action.triggered.connect(
-        partial(
-            aqt.dialogs.open,
-            name=am_globals.PROGRESSION_DIALOG_NAME,
-        )
-    )
-    return action
-
-
-def create_known_morphs_exporter_action(am_config: AnkiMorphsConfig) -> QAction:
-    action = QAction("&Known Morphs Exporter", mw)
-    action.setShortcut(am_config.shortcut_known_morphs_exporter)
-    action.triggered.connect(
-        partial(
-            aqt.dialogs.open,
-            name=am_globals.KNOWN_MORPHS_EXPORTER_DIALOG_NAME,
-        )
-    )
-    return action
-
-
-def create_test_action() -> QAction:
-    keys = QKeySequence("Ctrl+T")
-    action = QAction("&Test", mw)
-    action.setShortcut(keys)
-    action.triggered.connect(test_function)
-    return action
-
-
 def test_function() -> None:
     # To activate this dev function in Anki:
     # 1. In ankimorphs_globals.py set 'DEV_MODE = True'
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import functools
 import sqlite3
-from collections import Counter
 from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
@@ -35,6 +34,11 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
 
         self.con: sqlite3.Connection = sqlite3.connect(db_path)
 
+        # The database is a cache that recalc can rebuild from scratch at any
+        # time, so we can safely trade durability guarantees for speed.
+        self.con.execute("PRAGMA synchronous=OFF")
+        self.con.execute("PRAGMA temp_store=MEMORY")
+
     def __enter__(self) -> AnkiMorphsDB:
         """
         Creates a context manager
@@ -108,6 +112,19 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
                     """
             )
 
+    def create_card_morph_map_index(self) -> None:
+        # The primary key of Card_Morph_Map starts with card_id, so queries
+        # that look morphs up by (lemma, inflection) need this extra index.
+        # It is deliberately not part of create_all_tables: recalc creates it
+        # after the bulk inserts so the inserts don't pay for maintaining it.
+        with self.con:
+            self.con.execute(
+                """
+                    CREATE INDEX IF NOT EXISTS Card_Morph_Map_morph_index
+                    ON Card_Morph_Map (morph_lemma, morph_inflection)
+                    """
+            )
+
     def create_seen_morph_table(self) -> None:
         with self.con:
             self.con.execute(
@@ -121,62 +138,51 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
                     """
             )
 
+    # Note: the insert_many_* methods don't commit on their own;
+    # the caller is responsible for wrapping them in a transaction.
+    # This lets recalc do all the bulk inserts in one transaction
+    # and pay the fsync cost only once.
+
     def insert_many_into_card_table(
-        self, card_list: list[dict[str, int | str | bool]]
+        self, card_list: list[tuple[int, int, int, int, str]]
     ) -> None:
-        with self.con:
-            self.con.executemany(
-                """
-                    INSERT OR IGNORE INTO Cards VALUES
-                    (
-                       :card_id,
-                       :note_id,
-                       :note_type_id,
-                       :card_type,
-                       :tags
-                    )
-                    """,
-                card_list,
-            )
+        """
+        card rows: (card_id, note_id, note_type_id, card_type, tags)
+        """
+        self.con.executemany(
+            "INSERT OR IGNORE INTO Cards VALUES (?, ?, ?, ?, ?)",
+            card_list,
+        )
 
     def insert_many_into_morph_table(
-        self, morph_list: list[dict[str, int | str | bool]]
+        self, morph_list: list[tuple[str, str, int | None, int]]
     ) -> None:
-        with self.con:
-            # we only need to update the inflections on conflict since the lemmas
-            # have already been updated before they are inserted here
-            self.con.executemany(
-                """
-                    INSERT INTO Morphs
-                    VALUES
-                    (
-                       :lemma,
-                       :inflection,
-                       :highest_lemma_learning_interval,
-                       :highest_inflection_learning_interval
-                    )
-                    ON CONFLICT(lemma, inflection) DO UPDATE SET
-                        highest_inflection_learning_interval = :highest_inflection_learning_interval
-                    WHERE highest_inflection_learning_interval < :highest_inflection_learning_interval
-                """,
-                morph_list,
-            )
+        """
+        morph rows: (lemma, inflection, highest_lemma_learning_interval,
+        highest_inflection_learning_interval)
+        """
+        # we only need to update the inflections on conflict since the lemmas
+        # have already been updated before they are inserted here
+        self.con.executemany(
+            """
+                INSERT INTO Morphs VALUES (?, ?, ?, ?)
+                ON CONFLICT(lemma, inflection) DO UPDATE SET
+                    highest_inflection_learning_interval = excluded.highest_inflection_learning_interval
+                WHERE highest_inflection_learning_interval < excluded.highest_inflection_learning_interval
+            """,
+            morph_list,
+        )
 
     def insert_many_into_card_morph_map_table(
-        self, card_morph_list: list[dict[str, int | str | bool]]
+        self, card_morph_list: list[tuple[int, str, str]]
     ) -> None:
-        with self.con:
-            self.con.executemany(
-                """
-                    INSERT OR IGNORE INTO Card_Morph_Map VALUES
-                    (
-                       :card_id,
-                       :morph_lemma,
-                       :morph_inflection
-                    )
-                    """,
-                card_morph_list,
-            )
+        """
+        card morph map rows: (card_id, morph_lemma, morph_inflection)
+        """
+        self.con.executemany(
+            "INSERT OR IGNORE INTO Card_Morph_Map VALUES (?, ?, ?)",
+            card_morph_list,
+        )
 
     def get_readable_card_morphs(self, card_id: int) -> list[tuple[str, str]]:
         card_morphs: list[tuple[str, str]] = []
@@ -196,9 +202,10 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
 
         return card_morphs
 
-    def get_all_morphs_seen_today(self, only_lemma: bool = False) -> set[str]:
+    def get_all_morphs_seen_today(
+        self, only_lemma: bool = False
+    ) -> set[tuple[str, str]]:
         self.create_seen_morph_table()
-        card_morphs: set[str] = set("")
         select_statement: str = "SELECT lemma, inflection"
 
         if only_lemma:
@@ -212,10 +219,7 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
                     """
             ).fetchall()
 
-            for row in card_morphs_raw:
-                card_morphs.add(row[0] + row[1])
-
-        return card_morphs
+        return {(row[0], row[1]) for row in card_morphs_raw}
 
     def update_seen_morphs_today_single_card(self, card_id: int) -> None:
         with self.con:
@@ -345,47 +349,45 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
 
         return card_ids
 
-    def get_highest_inflection_learning_interval(self, morph: Morpheme) -> int | None:
+    def get_all_inflection_learning_intervals(self) -> dict[tuple[str, str], int]:
+        """
+        Fetches the highest inflection learning intervals of all morphs in
+        one query instead of one round trip per morph.
+        """
         with self.con:
-            highest_learning_interval = self.con.execute(
+            morphs_raw = self.con.execute(
                 """
-                    SELECT highest_inflection_learning_interval
+                    SELECT lemma, inflection, highest_inflection_learning_interval
                     FROM Morphs
-                    WHERE lemma = ? And inflection = ?
-                    """,
-                (morph.lemma, morph.inflection),
-            ).fetchone()
+                    """
+            ).fetchall()
 
-            if highest_learning_interval is None:
-                return None
+        return {(row[0], row[1]): row[2] for row in morphs_raw}
 
-            # un-tuple the result
-            highest_learning_interval = highest_learning_interval[0]
-            assert isinstance(highest_learning_interval, int)
-            return highest_learning_interval
+    def get_all_lemma_learning_intervals(self) -> dict[str, int]:
+        """
+        Fetches the highest lemma learning intervals of all morphs in
+        one query instead of one round trip per morph.
+        """
+        learning_intervals: dict[str, int] = {}
 
-    def get_highest_lemma_learning_interval(self, morph: Morpheme) -> int | None:
         with self.con:
-            highest_learning_interval = self.con.execute(
+            morphs_raw = self.con.execute(
                 """
-                    SELECT highest_lemma_learning_interval
+                    SELECT lemma, highest_lemma_learning_interval
                     FROM Morphs
-                    WHERE lemma = ?
-                    LIMIT 1
-                    """,
-                (morph.lemma,),
-            ).fetchone()
+                    """
+            ).fetchall()
 
-            if highest_learning_interval is None:
-                return None
+        for row in morphs_raw:
+            # the rows of a lemma all share the same value,
+            # so we only keep the first encountered one
+            learning_intervals.setdefault(row[0], row[1])
 
-            # un-tuple the result
-            highest_learning_interval = highest_learning_interval[0]
-            assert isinstance(highest_learning_interval, int)
-            return highest_learning_interval
+        return learning_intervals
 
-    def get_morph_inflections_learning_statuses(self) -> dict[str, str]:
-        morph_status_dict: dict[str, str] = {}
+    def get_morph_inflections_learning_statuses(self) -> dict[tuple[str, str], str]:
+        morph_status_dict: dict[tuple[str, str], str] = {}
         am_config = AnkiMorphsConfig()
 
         with self.con:
@@ -398,7 +400,7 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
             ).fetchall()
 
             for row in card_morphs_raw:
-                key = row[0] + row[1]
+                key = (row[0], row[1])
                 interval = row[2]
                 if interval >= am_config.interval_for_known_morphs:
                     learning_status = "known"
@@ -449,21 +451,16 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
                 Card_Morph_Map.morph_lemma = Morphs.lemma AND Card_Morph_Map.morph_inflection = Morphs.inflection
             ORDER BY Morphs.lemma, Morphs.inflection
             """,
-        ).fetchall()
+        )
 
         for row in card_morph_map_cache_raw:
-            card_id = row[0]
             morph = Morpheme(
                 lemma=row[1],
                 inflection=row[2],
                 highest_lemma_learning_interval=row[3],
                 highest_inflection_learning_interval=row[4],
             )
-
-            if card_id not in card_morph_map_cache:
-                card_morph_map_cache[card_id] = [morph]
-            else:
-                card_morph_map_cache[card_id].append(morph)
+            card_morph_map_cache.setdefault(row[0], []).append(morph)
 
         return card_morph_map_cache
 
@@ -481,51 +478,49 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
             WHERE note_type_id = ?
             """,
             (note_type_id,),
-        ).fetchall()
+        )
 
-        am_db_row_data_dict: dict[int, AnkiMorphsCardData] = {}
-        for am_data in map(AnkiMorphsCardData, result):
-            am_db_row_data_dict[am_data.card_id] = am_data
-        return am_db_row_data_dict
+        return {am_data.card_id: am_data for am_data in map(AnkiMorphsCardData, result)}
 
     # the cache needs to have a max size to maintain garbage collection
     @functools.lru_cache(maxsize=131072)
     def get_morph_priorities_from_collection(
         self, only_lemma_priorities: bool
     ) -> dict[tuple[str, str], int]:
-        # Sorting the morphs (ORDER BY) is crucial to avoid bugs
+        # Aggregating in sqlite avoids pulling every Card_Morph_Map row into
+        # Python just to count them. The secondary ORDER BY columns are crucial:
+        # they make the ordering of equally frequent morphs deterministic.
+        if only_lemma_priorities:
+            morphs_query = self.con.execute(
+                """
+                SELECT morph_lemma
+                FROM Card_Morph_Map
+                GROUP BY morph_lemma
+                ORDER BY COUNT(*) DESC, morph_lemma
+                """,
+            )
+            # Note: we can use a shortcut of providing the same priority (index) for
+            # both the lemma and the inflection since we generate the priorities from
+            # scratch every recalc, so which ever ends up being used will have the
+            # correct value.
+            return {
+                (lemma, lemma): index for index, (lemma,) in enumerate(morphs_query)
+            }
+
         morphs_query = self.con.execute(
             """
             SELECT morph_lemma, morph_inflection
             FROM Card_Morph_Map
-            ORDER BY morph_lemma, morph_inflection
+            GROUP BY morph_lemma, morph_inflection
+            ORDER BY COUNT(*) DESC, morph_lemma, morph_inflection
             """,
-        ).fetchall()
-
-        intermediate_morph_list = []
-
-        if only_lemma_priorities:
-            for lemma, _ in morphs_query:
-                intermediate_morph_list.append((lemma, lemma))
-        else:
-            for lemma, inflection in morphs_query:
-                intermediate_morph_list.append((lemma, inflection))
-
-        morphs_sorted_amount: dict[tuple[str, str], int] = dict(
-            Counter(intermediate_morph_list).most_common()
         )
 
-        morph_priorities: dict[tuple[str, str], int] = {}
-
-        # Reverse the values, the lower the priority number is, the more it is prioritized.
-        # Note: we can use a shortcut of providing the same priority (index) for both
-        # the lemma and the inflection since we generate the intermediate lists from
-        # scratch every recalc, so which ever ends up being used will have the correct value.
-        for index, key in enumerate(morphs_sorted_amount):
-            morph_priorities[key] = index
-            # print(f"key: {key}, index: {index}")
-
-        return morph_priorities
+        # The lower the priority number is, the more the morph is prioritized.
+        return {
+            (lemma, inflection): index
+            for index, (lemma, inflection) in enumerate(morphs_query)
+        }
 
     def get_known_lemmas_with_count(
         self, highest_lemma_learning_interval: int
@@ -588,11 +583,15 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
             self.con.execute("DROP TABLE IF EXISTS Card_Morph_Map;")
             self.con.execute("DROP TABLE IF EXISTS Seen_Morphs;")
 
+    def _drop_seen_morphs_table(self) -> None:
+        with self.con:
+            self.con.execute("DROP TABLE IF EXISTS Seen_Morphs;")
+
     @staticmethod
     def drop_seen_morphs_table() -> None:
         am_db = AnkiMorphsDB()
-        with am_db.con:
-            am_db.con.execute("DROP TABLE IF EXISTS Seen_Morphs;")
+        am_db._drop_seen_morphs_table()  # pylint:disable=protected-access
+        am_db.con.close()
 
     @staticmethod
     def rebuild_seen_morphs_today() -> None:
@@ -627,7 +626,9 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
             )
             where_query_string = where_query_string[:-3]  # removes the last " OR"
 
-        am_db.drop_seen_morphs_table()
+        # reuse the one connection for all the steps instead of
+        # paying the sqlite open/close cost three times over
+        am_db._drop_seen_morphs_table()  # pylint:disable=protected-access
         am_db.create_seen_morph_table()
 
         with am_db.con:
@@ -641,9 +642,9 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
                         """
                     + where_query_string
                 )
-        am_db.con.close()
 
-        am_db.insert_names_to_seen_morphs()
+        am_db._insert_names_to_seen_morphs()  # pylint:disable=protected-access
+        am_db.con.close()
 
     @staticmethod
     def get_new_cards_seen_today() -> Sequence[int]:
@@ -674,18 +675,21 @@ class AnkiMorphsDB:  # pylint:disable=too-many-public-methods
         known_and_skipped_cards: Sequence[int] = mw.col.find_cards(total_search_string)
         return known_and_skipped_cards
 
-    @staticmethod
-    def insert_names_to_seen_morphs() -> None:
+    def _insert_names_to_seen_morphs(self) -> None:
         name_morphs: list[tuple[str, str]] = get_names_from_file_as_morphs()
-        am_db = AnkiMorphsDB()
 
-        with am_db.con:
-            am_db.con.executemany(
+        with self.con:
+            self.con.executemany(
                 """
                     INSERT OR IGNORE INTO Seen_Morphs VALUES (?, ?)
                     """,
                 name_morphs,
             )
+
+    @staticmethod
+    def insert_names_to_seen_morphs() -> None:
+        am_db = AnkiMorphsDB()
+        am_db._insert_names_to_seen_morphs()  # pylint:disable=protected-access
         am_db.con.close()
 
 
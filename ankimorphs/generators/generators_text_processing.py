@@ -4,7 +4,9 @@
 # over-abstraction--the uses cases are sufficiently different that they
 # should be kept separate.
 
-import re
+import itertools
+from collections import Counter
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any, TextIO
 
@@ -13,6 +15,7 @@ from ..exceptions import UnicodeException
 from ..morpheme import Morpheme, MorphOccurrence
 from ..morphemizers.morphemizer import Morphemizer
 from ..text_preprocessing import (
+    filter_regexp,
     remove_names_textfile,
     round_brackets_regex,
     slim_round_brackets_regexp,
@@ -37,31 +40,27 @@ def create_file_morph_occurrences(
     file_io: TextIO,
     morphemizer: Morphemizer,
     nlp: Any,
-) -> dict[str, MorphOccurrence]:
+) -> dict[tuple[str, str], MorphOccurrence]:
     # nlp: spacy.Language
 
-    all_lines: list[str] = []
-    morph_occurrences: dict[str, MorphOccurrence]
+    # lazily filtering the lines avoids materializing the whole
+    # file in memory; lower-case to avoid proper noun false-positives
+    filtered_lines = (
+        filter_line(preprocess_options, line=line.lower()) for line in file_io
+    )
 
     try:
-        for line in file_io:
-            # lower-case to avoid proper noun false-positives
-            filtered_lines = filter_line(preprocess_options, line=line.lower())
-            all_lines.append(filtered_lines)
+        if nlp is not None:
+            return get_morph_occurrences_by_spacy(
+                preprocess_options, nlp, filtered_lines
+            )
+        return get_morph_occurrences_by_morphemizer(
+            preprocess_options, morphemizer, filtered_lines
+        )
     except UnicodeDecodeError as exc:
+        # the decoding happens lazily while the lines are consumed above
         raise UnicodeException(path=file_path) from exc
 
-    if nlp is not None:
-        morph_occurrences = get_morph_occurrences_by_spacy(
-            preprocess_options, nlp, all_lines
-        )
-    else:
-        morph_occurrences = get_morph_occurrences_by_morphemizer(
-            preprocess_options, morphemizer, all_lines
-        )
-
-    return morph_occurrences
-
 
 def filter_line(preprocess: PreprocessOptions, line: str) -> str:
 
@@ -78,26 +77,24 @@ def filter_line(preprocess: PreprocessOptions, line: str) -> str:
             line = slim_round_brackets_regexp.sub("", line)
 
     if preprocess.filter_numbers:
-        line = re.sub(r"\d", "", line)
+        line = filter_regexp.sub("", line)
 
     return line
 
 
 def get_morph_occurrences_by_spacy(
-    preprocess_options: PreprocessOptions, nlp: Any, all_lines: list[str]
-) -> dict[str, MorphOccurrence]:
-    morph_occurrences: dict[str, MorphOccurrence] = {}
-
-    for doc in nlp.pipe(all_lines):
-        morphs: list[Morpheme] = get_morphs_from_line_spacy(preprocess_options, doc=doc)
-        for morph in morphs:
-            key = morph.lemma + morph.inflection
-            if key in morph_occurrences:
-                morph_occurrences[key].occurrence += 1
-            else:
-                morph_occurrences[key] = MorphOccurrence(morph)
-
-    return morph_occurrences
+    preprocess_options: PreprocessOptions, nlp: Any, all_lines: Iterable[str]
+) -> dict[tuple[str, str], MorphOccurrence]:
+    # a single Counter.update over a chained iterator keeps the
+    # counting loop at the C-level instead of dispatching per line
+    morph_counter: Counter[Morpheme] = Counter()
+    morph_counter.update(
+        itertools.chain.from_iterable(
+            get_morphs_from_line_spacy(preprocess_options, doc=doc)
+            for doc in nlp.pipe(all_lines)
+        )
+    )
+    return _morph_occurrences_from_counter(morph_counter)
 
 
 def get_morphs_from_line_spacy(
@@ -131,24 +128,33 @@ def get_morphs_from_line_spacy(
 def get_morph_occurrences_by_morphemizer(
     preprocess_options: PreprocessOptions,
     morphemizer: Morphemizer,
-    all_lines: list[str],
-) -> dict[str, MorphOccurrence]:
-    morph_occurrences: dict[str, MorphOccurrence] = {}
-
-    for line in all_lines:
-        morphs: list[Morpheme] = get_morphs_from_line_morphemizer(
-            preprocess_options=preprocess_options,
-            morphemizer=morphemizer,
-            line=line,
+    all_lines: Iterable[str],
+) -> dict[tuple[str, str], MorphOccurrence]:
+    # a single Counter.update over a chained iterator keeps the
+    # counting loop at the C-level instead of dispatching per line
+    morph_counter: Counter[Morpheme] = Counter()
+    morph_counter.update(
+        itertools.chain.from_iterable(
+            get_morphs_from_line_morphemizer(
+                preprocess_options=preprocess_options,
+                morphemizer=morphemizer,
+                line=line,
+            )
+            for line in all_lines
         )
-        for morph in morphs:
-            key = morph.lemma + morph.inflection
-            if key in morph_occurrences:
-                morph_occurrences[key].occurrence += 1
-            else:
-                morph_occurrences[key] = MorphOccurrence(morph)
-
-    return morph_occurrences
+    )
+    return _morph_occurrences_from_counter(morph_counter)
+
+
+def _morph_occurrences_from_counter(
+    morph_counter: Counter[Morpheme],
+) -> dict[tuple[str, str], MorphOccurrence]:
+    # morphs hash on (lemma, inflection), so unlike the previous
+    # concatenated-string keys the tuple keys cannot collide
+    return {
+        (morph.lemma, morph.inflection): MorphOccurrence(morph, occurrence)
+        for morph, occurrence in morph_counter.items()
+    }
 
 
 def get_morphs_from_line_morphemizer(
@@ -88,17 +88,22 @@ class FileMorphsStats:
 def get_morph_stats_from_file(
     am_config: AnkiMorphsConfig,
     am_db: AnkiMorphsDB,
-    file_morphs: dict[str, MorphOccurrence],
+    file_morphs: dict[tuple[str, str], MorphOccurrence],
 ) -> FileMorphsStats:
     file_morphs_stats = FileMorphsStats()
     highest_learning_interval: int | None
 
+    # fetching all the learning intervals in one query avoids issuing
+    # one sql round trip per morph in the file
     if am_config.evaluate_morph_inflection:
+        inflection_learning_intervals: dict[tuple[str, str], int] = (
+            am_db.get_all_inflection_learning_intervals()
+        )
         for morph_occurrence_object in file_morphs.values():
             morph = morph_occurrence_object.morph
             occurrence = morph_occurrence_object.occurrence
-            highest_learning_interval = am_db.get_highest_inflection_learning_interval(
-                morph
+            highest_learning_interval = inflection_learning_intervals.get(
+                (morph.lemma, morph.inflection)
             )
 
             _update_file_morphs_stats(
@@ -109,10 +114,13 @@ def get_morph_stats_from_file(
                 highest_learning_interval=highest_learning_interval,
             )
     else:
+        lemma_learning_intervals: dict[str, int] = (
+            am_db.get_all_lemma_learning_intervals()
+        )
         for morph_occurrence_object in file_morphs.values():
             morph = morph_occurrence_object.morph
             occurrence = morph_occurrence_object.occurrence
-            highest_learning_interval = am_db.get_highest_lemma_learning_interval(morph)
+            highest_learning_interval = lemma_learning_intervals.get(morph.lemma)
 
             _update_file_morphs_stats(
                 file_morphs_stats=file_morphs_stats,
@@ -154,7 +162,7 @@ def generate_morph_occurrences_by_file(
     input_dir_root: Path,
     input_files: list[Path],
     sorted_by_table: int = False,
-) -> dict[Path, dict[str, MorphOccurrence]]:
+) -> dict[Path, dict[tuple[str, str], MorphOccurrence]]:
     """
     'sorted_by_table=True' is used for study plans where the order matters.
     """
@@ -164,7 +172,7 @@ def generate_morph_occurrences_by_file(
         morphemizers=morphemizers, morphemizer_combobox=ui.morphemizerComboBox
     )
     preprocess_options = PreprocessOptions(ui)
-    morph_occurrences_by_file: dict[Path, dict[str, MorphOccurrence]] = {}
+    morph_occurrences_by_file: dict[Path, dict[tuple[str, str], MorphOccurrence]] = {}
 
     sorted_input_files: list[Path]
 
@@ -188,7 +196,7 @@ def generate_morph_occurrences_by_file(
         )
 
         with open(input_file, encoding="utf-8") as file_io:
-            file_morph_occurrences: dict[str, MorphOccurrence] = (
+            file_morph_occurrences: dict[tuple[str, str], MorphOccurrence] = (
                 generators_text_processing.create_file_morph_occurrences(
                     preprocess_options=preprocess_options,
                     file_path=input_file,
@@ -248,28 +256,30 @@ def _get_input_files_table_sorted(
 
 
 def get_total_morph_occurrences_dict(
-    morph_occurrences_by_file: dict[Path, dict[str, MorphOccurrence]]
-) -> dict[str, MorphOccurrence]:
+    morph_occurrences_by_file: dict[Path, dict[tuple[str, str], MorphOccurrence]]
+) -> dict[tuple[str, str], MorphOccurrence]:
     """
-    Returns total_morph_occurrences: dict[str, MorphOccurrence]
-    where key: lemma + inflection
+    Returns total_morph_occurrences: dict[tuple[str, str], MorphOccurrence]
+    where key: (lemma, inflection)
     """
-    total_morph_occurrences: dict[str, MorphOccurrence] = {}
+    total_morph_occurrences: dict[tuple[str, str], MorphOccurrence] = {}
 
     for file_morph_dict in morph_occurrences_by_file.values():
-        for key in file_morph_dict:
+        for key, morph_occurrence in file_morph_dict.items():
             if key not in total_morph_occurrences:
-                total_morph_occurrences[key] = file_morph_dict[key]
+                total_morph_occurrences[key] = morph_occurrence
             else:
-                total_morph_occurrences[key] += file_morph_dict[key]
+                total_morph_occurrences[key] += morph_occurrence
 
     return total_morph_occurrences
 
 
 def get_morph_key_cutoff(
     selected_output_options: OutputOptions,
-    sorted_morph_occurrences: dict[str, MorphOccurrence],
-) -> str | None:
+    sorted_morph_occurrences: (
+        dict[str, MorphOccurrence] | dict[tuple[str, str], MorphOccurrence]
+    ),
+) -> str | tuple[str, str] | None:
     if selected_output_options.comprehension:
         morph_key_cutoff = get_comprehension_cutoff(
             sorted_morph_occurrences,
@@ -285,9 +295,11 @@ def get_morph_key_cutoff(
 
 
 def get_comprehension_cutoff(
-    sorted_morph_occurrence: dict[str, MorphOccurrence],
+    sorted_morph_occurrence: (
+        dict[str, MorphOccurrence] | dict[tuple[str, str], MorphOccurrence]
+    ),
     comprehension_threshold: int,
-) -> str | None:
+) -> str | tuple[str, str] | None:
     total_occurrences = 0
 
     for morph_occurrence in sorted_morph_occurrence.values():
@@ -308,17 +320,19 @@ def get_comprehension_cutoff(
 
 
 def get_min_occurrence_cutoff(
-    sorted_morph_occurrence: dict[str, MorphOccurrence],
+    sorted_morph_occurrence: (
+        dict[str, MorphOccurrence] | dict[tuple[str, str], MorphOccurrence]
+    ),
     min_occurrence_threshold: int,
-) -> str | None:
-    for morph_key in sorted_morph_occurrence:
-        if sorted_morph_occurrence[morph_key].occurrence < min_occurrence_threshold:
+) -> str | tuple[str, str] | None:
+    for morph_key, morph_occurrence in sorted_morph_occurrence.items():
+        if morph_occurrence.occurrence < min_occurrence_threshold:
             return morph_key
     return None
 
 
 def get_sorted_lemma_occurrence_dict(
-    morph_occurrence_dict_original: dict[str, MorphOccurrence]
+    morph_occurrence_dict_original: dict[tuple[str, str], MorphOccurrence]
 ) -> dict[str, MorphOccurrence]:
     """
     This creates a new dict with keys that only consist of the lemma, and
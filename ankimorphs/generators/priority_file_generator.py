@@ -25,7 +25,7 @@ def background_generate_priority_file(
     assert mw.progress is not None
 
     # pylint: disable=duplicate-code
-    morph_occurrences_by_file: dict[Path, dict[str, MorphOccurrence]] = (
+    morph_occurrences_by_file: dict[Path, dict[tuple[str, str], MorphOccurrence]] = (
         generators_utils.generate_morph_occurrences_by_file(
             ui=ui,
             morphemizers=morphemizers,
@@ -42,8 +42,8 @@ def background_generate_priority_file(
         )
     )
 
-    # key: lemma + inflection
-    total_morph_occurrences: dict[str, MorphOccurrence] = (
+    # key: (lemma, inflection)
+    total_morph_occurrences: dict[tuple[str, str], MorphOccurrence] = (
         generators_utils.get_total_morph_occurrences_dict(morph_occurrences_by_file)
     )
 
@@ -52,7 +52,7 @@ def background_generate_priority_file(
 
 def write_out_priority_file(
     selected_output_options: OutputOptions,
-    total_morph_occurrences: dict[str, MorphOccurrence],
+    total_morph_occurrences: dict[tuple[str, str], MorphOccurrence],
 ) -> None:
 
     output_file: Path = selected_output_options.output_path
@@ -74,7 +74,7 @@ def write_out_priority_file(
 
 def lemma_and_inflection_writer(  # pylint:disable=too-many-locals
     selected_output_options: OutputOptions,
-    total_morph_occurrences: dict[str, MorphOccurrence],
+    total_morph_occurrences: dict[tuple[str, str], MorphOccurrence],
 ) -> None:
     output_file: Path = selected_output_options.output_path
 
@@ -134,7 +134,7 @@ def lemma_and_inflection_writer(  # pylint:disable=too-many-locals
 
 def lemma_only_writer(
     selected_output_options: OutputOptions,
-    total_morph_occurrences: dict[str, MorphOccurrence],
+    total_morph_occurrences: dict[tuple[str, str], MorphOccurrence],
 ) -> None:
     output_file: Path = selected_output_options.output_path
     headers = [am_globals.LEMMA_HEADER]
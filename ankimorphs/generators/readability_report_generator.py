@@ -29,7 +29,7 @@ def background_generate_report(
     if len(input_files) == 0:
         raise EmptyFileSelectionException
 
-    morph_occurrences_by_file: dict[Path, dict[str, MorphOccurrence]] = (
+    morph_occurrences_by_file: dict[Path, dict[tuple[str, str], MorphOccurrence]] = (
         generators_utils.generate_morph_occurrences_by_file(
             ui=ui,
             morphemizers=morphemizers,
@@ -68,7 +68,7 @@ def _populate_tables_with_report(
     ui: Ui_GeneratorsWindow,
     input_dir_root: Path,
     input_files: list[Path],
-    morph_occurrences_by_file: dict[Path, dict[str, MorphOccurrence]],
+    morph_occurrences_by_file: dict[Path, dict[tuple[str, str], MorphOccurrence]],
 ) -> None:
     am_config = AnkiMorphsConfig()
     am_db = AnkiMorphsDB()
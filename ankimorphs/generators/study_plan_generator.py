@@ -25,7 +25,7 @@ def background_generate_study_plan(
     assert mw is not None
     assert mw.progress is not None
 
-    morph_occurrences_by_file: dict[Path, dict[str, MorphOccurrence]] = (
+    morph_occurrences_by_file: dict[Path, dict[tuple[str, str], MorphOccurrence]] = (
         generators_utils.generate_morph_occurrences_by_file(
             ui=ui,
             morphemizers=morphemizers,
@@ -52,7 +52,7 @@ def background_generate_study_plan(
 def write_out_study_plan(  # pylint:disable=too-many-locals
     input_dir_root: Path,
     selected_output_options: OutputOptions,
-    morph_occurrences_by_file: dict[Path, dict[str, MorphOccurrence]],
+    morph_occurrences_by_file: dict[Path, dict[tuple[str, str], MorphOccurrence]],
 ) -> None:
     # Note: the study plan cannot have a full-format where one can switch
     # between evaluating lemmas and inflections like you can with regular
@@ -66,13 +66,18 @@ def write_out_study_plan(  # pylint:disable=too-many-locals
     # make sure the parent dirs exist before creating the file
     Path(output_file).parent.mkdir(parents=True, exist_ok=True)
 
-    morph_in_study_plan: dict[str, None] = {}  # we only care about lookup not the value
-    learning_status_of_morph: dict[str, str]
+    # we only care about lookup not the value
+    morph_in_study_plan: dict[str | tuple[str, str], None] = {}
+
+    # the lemma and inflection dicts are keyed differently, so we keep them
+    # separate to make the lookups below type safe
+    lemma_learning_statuses: dict[str, str] = {}
+    inflection_learning_statuses: dict[tuple[str, str], str] = {}
 
     if selected_output_options.store_lemma_and_inflection:
-        learning_status_of_morph = am_db.get_morph_inflections_learning_statuses()
+        inflection_learning_statuses = am_db.get_morph_inflections_learning_statuses()
     else:
-        learning_status_of_morph = am_db.get_morph_lemmas_learning_statuses()
+        lemma_learning_statuses = am_db.get_morph_lemmas_learning_statuses()
 
     with open(output_file, mode="w+", encoding="utf-8", newline="") as csvfile:
         morph_writer = csv.writer(csvfile)
@@ -86,8 +91,10 @@ def write_out_study_plan(  # pylint:disable=too-many-locals
                     file_morph_occurrences
                 )
             )
-            sorted_dict_to_use: dict[str, MorphOccurrence]
-            morph_key_cutoff: str | None
+            sorted_dict_to_use: (
+                dict[str, MorphOccurrence] | dict[tuple[str, str], MorphOccurrence]
+            )
+            morph_key_cutoff: str | tuple[str, str] | None
 
             if selected_output_options.store_lemma_and_inflection:
                 sorted_inflection_occurrences = dict(
@@ -118,12 +125,17 @@ def write_out_study_plan(  # pylint:disable=too-many-locals
                 if key in morph_in_study_plan:
                     continue
 
+                # "unknown" means the morph is not in the database
+                if isinstance(key, str):
+                    learning_status = lemma_learning_statuses.get(key, "unknown")
+                else:
+                    learning_status = inflection_learning_statuses.get(key, "unknown")
+
                 row = _get_study_plan_row(
                     selected_output_options=selected_output_options,
                     input_dir_root=input_dir_root,
                     file_path=file_path,
-                    learning_status_of_morph=learning_status_of_morph,
-                    morph_key=key,
+                    learning_status=learning_status,
                     morph_occurrence=morph_occurrence,
                 )
 
@@ -161,21 +173,13 @@ def _get_study_plan_headers(selected_output_options: OutputOptions) -> list[str]
     return headers
 
 
-def _get_study_plan_row(  # pylint:disable=too-many-arguments
+def _get_study_plan_row(
     selected_output_options: OutputOptions,
     input_dir_root: Path,
     file_path: Path,
-    learning_status_of_morph: dict[str, str],
-    morph_key: str,
+    learning_status: str,
     morph_occurrence: MorphOccurrence,
 ) -> list[str]:
-    learning_status: str
-
-    if morph_key not in learning_status_of_morph:
-        learning_status = "unknown"
-    else:
-        learning_status = learning_status_of_morph[morph_key]
-
     row = [morph_occurrence.morph.lemma]
 
     if selected_output_options.store_lemma_and_inflection:
@@ -180,12 +180,13 @@ class KnownMorphsExporterDialog(QDialog):
             morph_writer = csv.writer(csvfile)
             morph_writer.writerow(headers)
 
+            # writerows batches the per-row dispatch into one C-level loop
             if selected_extra_occurrences_column:
-                for lemma, inflection, inflection_count in export_list:
-                    morph_writer.writerow([lemma, inflection, inflection_count])
+                morph_writer.writerows(export_list)
             else:
-                for lemma, inflection, _ in export_list:
-                    morph_writer.writerow([lemma, inflection])
+                morph_writer.writerows(
+                    (lemma, inflection) for lemma, inflection, _ in export_list
+                )
 
     @staticmethod
     def _export_lemmas(
@@ -205,12 +206,11 @@ class KnownMorphsExporterDialog(QDialog):
             morph_writer = csv.writer(csvfile)
             morph_writer.writerow(headers)
 
+            # writerows batches the per-row dispatch into one C-level loop
             if selected_extra_occurrences_column:
-                for lemma, count in export_list:
-                    morph_writer.writerow([lemma, count])
+                morph_writer.writerows(export_list)
             else:
-                for lemma, _ in export_list:
-                    morph_writer.writerow([lemma])
+                morph_writer.writerows((lemma,) for lemma, _ in export_list)
 
     def closeWithCallback(  # pylint:disable=invalid-name
         self, callback: Callable[[], None]
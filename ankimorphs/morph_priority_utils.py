@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+import os
 from pathlib import Path
 from typing import Any
 
@@ -43,11 +44,21 @@ class PriorityFile:
 
 def get_priority_files() -> list[str]:
     assert mw is not None
-    path_generator = Path(
-        mw.pm.profileFolder(), am_globals.PRIORITY_FILES_DIR_NAME
-    ).glob("*.csv")
-    priority_files = [file.name for file in path_generator if file.is_file()]
-    return priority_files
+    priority_files_dir = Path(mw.pm.profileFolder(), am_globals.PRIORITY_FILES_DIR_NAME)
+    try:
+        # os.scandir is cheaper than Path.glob since it avoids fnmatch
+        # compilation and reuses the dirent info for the is_file check;
+        # lower-casing the name keeps matching case-insensitive like
+        # Path.glob is on windows, so files like 'FREQ.CSV' are found
+        with os.scandir(priority_files_dir) as dir_entries:
+            return [
+                entry.name
+                for entry in dir_entries
+                if entry.name.lower().endswith(".csv") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        # same behavior as Path.glob on a missing directory
+        return []
 
 
 def get_morph_priority(
@@ -32,9 +32,23 @@ if sys.maxunicode > 0xFFFF:
 ################################################################################
 
 
+def jieba_found() -> bool:
+    """
+    Cheaply checks if a jieba add-on is installed, without triggering
+    the expensive prefix-dict build that import_jieba() performs.
+    """
+    return (
+        importlib.util.find_spec("1857311956") is not None
+        or importlib.util.find_spec("ankimorphs_chinese_jieba") is not None
+    )
+
+
 def import_jieba() -> None:
     global posseg, successful_startup
 
+    if successful_startup:
+        return
+
     if importlib.util.find_spec("1857311956"):
         posseg = importlib.import_module("1857311956.jieba.posseg")
     elif importlib.util.find_spec("ankimorphs_chinese_jieba"):
@@ -38,12 +38,26 @@ _mecab_args = [
 successful_startup: bool = False
 
 
+def mecab_found() -> bool:
+    """
+    Cheaply checks if a mecab add-on is installed, without triggering
+    the expensive dictionary loading that setup_mecab() performs.
+    """
+    return (
+        importlib.util.find_spec("1974309724") is not None
+        or importlib.util.find_spec("ankimorphs_japanese_mecab") is not None
+    )
+
+
 def setup_mecab() -> None:
     global successful_startup
     global _mecab_windows_startupinfo
     global _mecab_encoding
     global _mecab_base_cmd
 
+    if successful_startup:
+        return
+
     # startup_info has the type: subprocess.STARTUPINFO, but that type
     # is only available on Windows, so we can't use type annotations here
     _mecab_windows_startupinfo = get_windows_startup_info()
@@ -58,13 +58,13 @@ def get_all_morphemizers() -> list[Morphemizer]:
             SimpleSpaceAndPunctuationMorphemizer(),
         ]
 
-        _mecab = MecabMorphemizer()
-        if mecab_wrapper.successful_startup:
-            morphemizers.append(_mecab)
+        # only probe for the backend add-ons here; the expensive backend
+        # startup is deferred until the morphemizer is actually used
+        if mecab_wrapper.mecab_found():
+            morphemizers.append(MecabMorphemizer())
 
-        _jieba = JiebaMorphemizer()
-        if jieba_wrapper.successful_startup:
-            morphemizers.append(_jieba)
+        if jieba_wrapper.jieba_found():
+            morphemizers.append(JiebaMorphemizer())
 
         for spacy_model in spacy_wrapper.get_installed_models():
             morphemizers.append(SpacyMorphemizer(spacy_model))
@@ -88,11 +88,9 @@ def get_morphemizer_by_description(description: str) -> Morphemizer | None:
 
 class MecabMorphemizer(Morphemizer):
 
-    def __init__(self) -> None:
-        super().__init__()
-        mecab_wrapper.setup_mecab()
-
     def _get_morphemes_from_expr(self, expression: str) -> list[Morpheme]:
+        if not mecab_wrapper.successful_startup:
+            mecab_wrapper.setup_mecab()
         # Remove simple spaces that could be added by other add-ons and break the parsing.
         if space_char_regex.search(expression):
             expression = space_char_regex.sub("", expression)
@@ -181,11 +179,9 @@ class SpacyMorphemizer(Morphemizer):
 class JiebaMorphemizer(Morphemizer):
     # Jieba Chinese text segmentation: https://github.com/fxsjy/jieba
 
-    def __init__(self) -> None:
-        super().__init__()
-        jieba_wrapper.import_jieba()
-
     def _get_morphemes_from_expr(self, expression: str) -> list[Morpheme]:
+        if not jieba_wrapper.successful_startup:
+            jieba_wrapper.import_jieba()
         return jieba_wrapper.get_morphemes_jieba(expression)
 
     def get_description(self) -> str:
@@ -1,28 +1,41 @@
+import time
 from functools import partial
 
 from aqt import mw
 
 from .exceptions import CancelledOperationException
 
+# updating the progress dialog queues an event on the Qt main thread, so
+# instead of firing one update per N loop iterations we rate limit them
+# by elapsed time; this keeps fast loops from flooding the event queue
+# and keeps slow loops responsive without any per-caller tuning
+_UPDATE_INTERVAL_SECONDS: float = 0.1
+_next_update_time: float = 0.0
+
 
 def background_update_progress_potentially_cancel(
-    label: str, counter: int, max_value: int, increment: int = 1000
+    label: str, counter: int, max_value: int
 ) -> None:
+    global _next_update_time
+
     assert mw is not None
 
-    if counter % increment == 0:
-        # time.sleep(0.3)
-        if mw.progress.want_cancel():  # user clicked 'x'
-            raise CancelledOperationException
-
-        mw.taskman.run_on_main(
-            partial(
-                mw.progress.update,
-                label=label,
-                value=counter,
-                max=max_value,
-            )
+    now = time.monotonic()
+    if now < _next_update_time:
+        return
+    _next_update_time = now + _UPDATE_INTERVAL_SECONDS
+
+    if mw.progress.want_cancel():  # user clicked 'x'
+        raise CancelledOperationException
+
+    mw.taskman.run_on_main(
+        partial(
+            mw.progress.update,
+            label=label,
+            value=counter,
+            max=max_value,
         )
+    )
 
 
 def background_update_progress(label: str) -> None:
@@ -95,13 +95,14 @@ def get_progress_reports(
 ) -> list[ProgressReport]:
     reports = []
 
-    # This function could be cleaner if the learning status dictionaries were
-    # keyed like the morph_priority dictionaries.
-    morph_learning_statuses: dict[str, str]
+    # the lemma and inflection dicts are keyed differently, so we keep them
+    # separate to make the lookups below type safe
+    lemma_learning_statuses: dict[str, str] = {}
+    inflection_learning_statuses: dict[tuple[str, str], str] = {}
     if only_lemma_priorities:
-        morph_learning_statuses = am_db.get_morph_lemmas_learning_statuses()
+        lemma_learning_statuses = am_db.get_morph_lemmas_learning_statuses()
     else:
-        morph_learning_statuses = am_db.get_morph_inflections_learning_statuses()
+        inflection_learning_statuses = am_db.get_morph_inflections_learning_statuses()
 
     for min_priority, max_priority in bins.indexes:
 
@@ -112,15 +113,12 @@ def get_progress_reports(
 
         for morph in morph_priorities_subset:
 
-            learning_status_key = morph[0] + morph[1]
+            # "missing" means the morph is not in the database
             if only_lemma_priorities:
-                learning_status_key = morph[0]  # expect morph=(lemma,lemma)
-
-            morph_status = "missing"
-            if (
-                learning_status_key in morph_learning_statuses
-            ):  # if the morph is in the database
-                morph_status = morph_learning_statuses[learning_status_key]
+                # expect morph=(lemma,lemma)
+                morph_status = lemma_learning_statuses.get(morph[0], "missing")
+            else:
+                morph_status = inflection_learning_statuses.get(morph, "missing")
             _update_progress_report(report, morph, morph_status)
 
         reports.append(report)
@@ -150,27 +148,25 @@ def get_priority_ordered_morph_statuses(
         )
     )
 
-    morph_learning_statuses: dict[str, str]
+    # the lemma and inflection dicts are keyed differently, so we keep them
+    # separate to make the lookups below type safe
+    lemma_learning_statuses: dict[str, str] = {}
+    inflection_learning_statuses: dict[tuple[str, str], str] = {}
     if only_lemma_priorities:
-        morph_learning_statuses = am_db.get_morph_lemmas_learning_statuses()
+        lemma_learning_statuses = am_db.get_morph_lemmas_learning_statuses()
     else:
-        morph_learning_statuses = am_db.get_morph_inflections_learning_statuses()
+        inflection_learning_statuses = am_db.get_morph_inflections_learning_statuses()
 
     for morph in sorted_morph_priorities:
         priority = sorted_morph_priorities[morph]
-        learning_status_key = morph[0] + morph[1]
-        if only_lemma_priorities:
-            learning_status_key = morph[0]  # expect morph=(lemma,lemma)
-
-        morph_status = "missing"
-        if (
-            learning_status_key in morph_learning_statuses
-        ):  # if the morph is in the database
-            morph_status = morph_learning_statuses[learning_status_key]
 
+        # "missing" means the morph is not in the database
         if only_lemma_priorities:
+            # expect morph=(lemma,lemma)
+            morph_status = lemma_learning_statuses.get(morph[0], "missing")
             morph_statuses.append((priority, morph[0], "-", morph_status))
         else:
+            morph_status = inflection_learning_statuses.get(morph, "missing")
             morph_statuses.append((priority, morph[0], morph[1], morph_status))
 
     return morph_statuses
@@ -130,12 +130,12 @@ class AnkiMorphsCardData:
 
 def create_card_data_dict(
     am_config: AnkiMorphsConfig,
+    tag_manager: TagManager,
     config_filter: AnkiMorphsConfigFilter,
 ) -> dict[int, AnkiCardData]:
     assert mw is not None
 
     model_manager: ModelManager = mw.col.models
-    tag_manager = TagManager(mw.col)
     tags: dict[str, str] = config_filter.tags
     card_data_dict: dict[int, AnkiCardData] = {}
 
@@ -147,7 +147,12 @@ def create_card_data_dict(
     existing_field_names: list[str] = model_manager.field_names(note_type_dict)
     field_index: int = existing_field_names.index(config_filter.field)
 
-    for anki_row_data in _get_anki_data(am_config, note_type_id, tags).values():
+    # constructing AnkiCardData in a single pass over the rows means the
+    # AnkiDBRowData objects can be garbage collected as they are consumed,
+    # instead of keeping an entire intermediate dict of them alive
+    for anki_row_data in map(
+        AnkiDBRowData, _get_anki_data(am_config, note_type_id, tags)
+    ):
         card_data = AnkiCardData(
             am_config=am_config,
             tag_manager=tag_manager,
@@ -162,60 +167,53 @@ def create_card_data_dict(
 
 def _get_anki_data(
     am_config: AnkiMorphsConfig, model_id: NotetypeId, tags_object: dict[str, str]
-) -> dict[int, AnkiDBRowData]:
+) -> list[Sequence[Any]]:
     ################################################################
     #                        SQL QUERY
     ################################################################
-    # This sql query is horrible, partly because of the limitation
-    # in sqlite where you can't really build a query with variable
-    # parameter length (tags in this case)
-    # More info:
-    # https://stackoverflow.com/questions/5766230/select-from-sqlite-table-where-rowid-in-list-using-python-sqlite3-db-api-2-0
+    # The WHERE clause has a variable length (tags in this case),
+    # so we build a list of '?' placeholder clauses and a matching
+    # list of parameters.
     #
     # EXAMPLE FINAL SQL QUERY:
     #   SELECT cards.id, cards.ivl, cards.type, cards.queue, notes.id, notes.flds, notes.tags
     #   FROM cards
     #   INNER JOIN notes ON
     #       cards.nid = notes.id
-    #   WHERE notes.mid = 1691076536776 AND (cards.queue != -1 OR notes.tags LIKE '% am-known-manually %') AND notes.tags LIKE '% movie %'
+    #   WHERE notes.mid = ? AND (cards.queue != -1 OR notes.tags LIKE ?) AND notes.tags LIKE ?
     ################################################################
 
     assert mw is not None
     assert mw.col.db is not None
 
-    ignore_suspended_cards = ""
+    # using '?' placeholders instead of interpolating the values into the
+    # query string lets sqlite reuse the compiled statement across the
+    # per-filter loop, and side-steps any quoting issues with the tags
+    where_clauses: list[str] = ["notes.mid = ?"]
+    params: list[Any] = [model_id]
+
     if am_config.preprocess_ignore_suspended_cards_content:
         # If this part is included, then we don't get cards that are suspended EXCEPT for
         # the cards that were 'set known and skip' and later suspended. We want to always
         # include those cards otherwise we can lose track of known morphs
-        ignore_suspended_cards = f" AND (cards.queue != -1 OR notes.tags LIKE '% {am_config.tag_known_manually} %')"
-
-    excluded_tags = tags_object["exclude"]
-    included_tags = tags_object["include"]
-    tags_search_string = ""
+        where_clauses.append("(cards.queue != -1 OR notes.tags LIKE ?)")
+        params.append(f"% {am_config.tag_known_manually} %")
 
-    if len(excluded_tags) > 0:
-        tags_search_string += "".join(
-            [f" AND notes.tags NOT LIKE '% {_tag} %'" for _tag in excluded_tags]
-        )
-    if len(included_tags) > 0:
-        tags_search_string += "".join(
-            [f" AND notes.tags LIKE '% {_tag} %'" for _tag in included_tags]
-        )
+    for _tag in tags_object["exclude"]:
+        where_clauses.append("notes.tags NOT LIKE ?")
+        params.append(f"% {_tag} %")
+    for _tag in tags_object["include"]:
+        where_clauses.append("notes.tags LIKE ?")
+        params.append(f"% {_tag} %")
 
-    result: list[Sequence[Any]] = mw.col.db.all(
+    return mw.col.db.all(
         """
         SELECT cards.id, cards.ivl, cards.type, cards.queue, notes.id, notes.flds, notes.tags
         FROM cards
         INNER JOIN notes ON
             cards.nid = notes.id
         """
-        + f"WHERE notes.mid = {model_id}{ignore_suspended_cards}{tags_search_string}",
+        + "WHERE "
+        + " AND ".join(where_clauses),
+        *params,
     )
-
-    anki_db_row_data_dict: dict[int, AnkiDBRowData] = {}
-
-    for anki_data in map(AnkiDBRowData, result):
-        anki_db_row_data_dict[anki_data.card_id] = anki_data
-
-    return anki_db_row_data_dict
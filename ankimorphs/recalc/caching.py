@@ -4,6 +4,7 @@ import csv
 from pathlib import Path
 from typing import Any
 
+from anki.tags import TagManager
 from aqt import mw
 
 from .. import ankimorphs_globals as am_globals
@@ -43,10 +44,19 @@ def cache_anki_data(  # pylint:disable=too-many-locals, too-many-branches, too-m
     am_db.drop_all_tables()
     am_db.create_all_tables()
 
-    # These lists contain data that will be inserted into ankimorphs.db
-    card_table_data: list[dict[str, Any]] = []
-    morph_table_data: list[dict[str, Any]] = []
-    card_morph_map_table_data: list[dict[str, Any]] = []
+    # These lists contain row tuples that will be inserted into ankimorphs.db;
+    # plain tuples are much smaller than per-row dicts and bind faster
+    card_table_data: list[tuple[int, int, int, int, str]] = []
+    card_morph_map_table_data: list[tuple[int, str, str]] = []
+
+    # The same morph can occur on thousands of cards, and the morph table
+    # upsert only ever keeps the highest inflection interval, so instead of
+    # inserting one row per occurrence we aggregate the intervals here and
+    # insert each unique morph once.
+    highest_inflection_intervals: dict[tuple[str, str], int] = {}
+
+    # the tag manager is the same for every note filter
+    tag_manager = TagManager(mw.col)
 
     # We only want to cache the morphs on the note-filters that have 'read' enabled
     for config_filter in read_enabled_config_filters:
@@ -54,6 +64,7 @@ def cache_anki_data(  # pylint:disable=too-many-locals, too-many-branches, too-m
         cards_data_dict: dict[int, AnkiCardData] = (
             anki_data_utils.create_card_data_dict(
                 am_config,
+                tag_manager,
                 config_filter,
             )
         )
@@ -162,55 +173,63 @@ def cache_anki_data(  # pylint:disable=too-many-locals, too-many-branches, too-m
                 highest_interval = card_data.interval
 
             card_table_data.append(
-                {
-                    "card_id": card_id,
-                    "note_id": card_data.note_id,
-                    "note_type_id": card_data.note_type_id,
-                    "card_type": card_data.type,
-                    "fields": card_data.fields,
-                    "tags": card_data.tags,
-                }
+                (
+                    card_id,
+                    card_data.note_id,
+                    card_data.note_type_id,
+                    card_data.type,
+                    card_data.tags,
+                )
             )
 
             if card_data.morphs is None:
                 continue
 
             for morph in card_data.morphs:
-                morph_table_data.append(
-                    {
-                        "lemma": morph.lemma,
-                        "inflection": morph.inflection,
-                        "highest_lemma_learning_interval": None,
-                        "highest_inflection_learning_interval": highest_interval,
-                    }
-                )
+                morph_key = (morph.lemma, morph.inflection)
+                if highest_interval > highest_inflection_intervals.get(morph_key, -1):
+                    highest_inflection_intervals[morph_key] = highest_interval
                 card_morph_map_table_data.append(
-                    {
-                        "card_id": card_id,
-                        "morph_lemma": morph.lemma,
-                        "morph_inflection": morph.inflection,
-                    }
+                    (card_id, morph.lemma, morph.inflection)
                 )
 
     if am_config.read_known_morphs_folder is True:
         progress_utils.background_update_progress(label="Importing known morphs")
-        morph_table_data += _get_morphs_from_files(am_config)
+        for lemma, inflection, _, inflection_interval in _get_morphs_from_files(
+            am_config
+        ):
+            morph_key = (lemma, inflection)
+            if inflection_interval > highest_inflection_intervals.get(morph_key, -1):
+                highest_inflection_intervals[morph_key] = inflection_interval
+
+    morph_table_data: list[tuple[str, str, int | None, int]] = [
+        (lemma, inflection, None, interval)
+        for (lemma, inflection), interval in highest_inflection_intervals.items()
+    ]
 
     progress_utils.background_update_progress(label="Updating learning intervals")
-    _update_learning_intervals(am_config, morph_table_data)
+    morph_table_data = _update_learning_intervals(am_config, morph_table_data)
 
     progress_utils.background_update_progress(label="Saving to ankimorphs.db")
-    am_db.insert_many_into_morph_table(morph_table_data)
-    am_db.insert_many_into_card_table(card_table_data)
-    am_db.insert_many_into_card_morph_map_table(card_morph_map_table_data)
+    # one transaction for all the bulk inserts means sqlite only
+    # has to sync to disk once
+    with am_db.con:
+        am_db.insert_many_into_morph_table(morph_table_data)
+        am_db.insert_many_into_card_table(card_table_data)
+        am_db.insert_many_into_card_morph_map_table(card_morph_map_table_data)
+    # building the index after the bulk inserts is cheaper than
+    # maintaining it for every inserted row
+    am_db.create_card_morph_map_index()
     # am_db.print_table("Morphs")
     am_db.con.close()
 
 
-def _get_morphs_from_files(am_config: AnkiMorphsConfig) -> list[dict[str, Any]]:
+def _get_morphs_from_files(
+    am_config: AnkiMorphsConfig,
+) -> list[tuple[str, str, int | None, int]]:
     assert mw is not None
 
-    morphs_from_files: list[dict[str, Any]] = []
+    morphs_from_files: list[tuple[str, str, int | None, int]] = []
     input_files: list[Path] = _get_known_morphs_files()
 
     for input_file in input_files:
@@ -284,20 +303,16 @@ def _get_lemma_and_inflection_columns(
 
 def _get_morphs_from_minimum_format(
     am_config: AnkiMorphsConfig, morph_reader: Any, lemma_column: int
-) -> list[dict[str, Any]]:
-    morphs_from_files: list[dict[str, Any]] = []
-
-    for row in morph_reader:
-        lemma: str = row[lemma_column]
-        morphs_from_files.append(
-            {
-                "lemma": lemma,
-                "inflection": lemma,
-                "highest_lemma_learning_interval": am_config.interval_for_known_morphs,
-                "highest_inflection_learning_interval": am_config.interval_for_known_morphs,
-            }
+) -> list[tuple[str, str, int | None, int]]:
+    return [
+        (
+            row[lemma_column],
+            row[lemma_column],
+            am_config.interval_for_known_morphs,
+            am_config.interval_for_known_morphs,
         )
-    return morphs_from_files
+        for row in morph_reader
+    ]
 
 
 def _get_morphs_from_full_format(
@@ -305,58 +320,51 @@ def _get_morphs_from_full_format(
     morph_reader: Any,
     lemma_column: int,
     inflection_column: int,
-) -> list[dict[str, Any]]:
-    morphs_from_files: list[dict[str, Any]] = []
-
-    for row in morph_reader:
-        lemma: str = row[lemma_column]
-        inflection: str = row[inflection_column]
-        morphs_from_files.append(
-            {
-                "lemma": lemma,
-                "inflection": inflection,
-                "highest_lemma_learning_interval": am_config.interval_for_known_morphs,
-                "highest_inflection_learning_interval": am_config.interval_for_known_morphs,
-            }
+) -> list[tuple[str, str, int | None, int]]:
+    return [
+        (
+            row[lemma_column],
+            row[inflection_column],
+            am_config.interval_for_known_morphs,
+            am_config.interval_for_known_morphs,
         )
-    return morphs_from_files
+        for row in morph_reader
+    ]
 
 
 def _update_learning_intervals(
-    am_config: AnkiMorphsConfig, morph_table_data: list[dict[str, Any]]
-) -> None:
+    am_config: AnkiMorphsConfig,
+    morph_table_data: list[tuple[str, str, int | None, int]],
+) -> list[tuple[str, str, int | None, int]]:
     learning_intervals_of_lemmas: dict[str, int] = _get_learning_intervals_of_lemmas(
         morph_table_data
     )
 
     if am_config.evaluate_morph_lemma:
         # update both the lemma and inflection intervals
-        for morph_data_dict in morph_table_data:
-            lemma = morph_data_dict["lemma"]
-            morph_data_dict["highest_lemma_learning_interval"] = (
-                learning_intervals_of_lemmas[lemma]
-            )
-            morph_data_dict["highest_inflection_learning_interval"] = (
-                learning_intervals_of_lemmas[lemma]
-            )
-    else:
-        # only update lemma intervals
-        for morph_data_dict in morph_table_data:
-            lemma = morph_data_dict["lemma"]
-            morph_data_dict["highest_lemma_learning_interval"] = (
-                learning_intervals_of_lemmas[lemma]
+        return [
+            (
+                lemma,
+                inflection,
+                learning_intervals_of_lemmas[lemma],
+                learning_intervals_of_lemmas[lemma],
             )
+            for lemma, inflection, _, _ in morph_table_data
+        ]
+
+    # only update lemma intervals
+    return [
+        (lemma, inflection, learning_intervals_of_lemmas[lemma], inflection_interval)
+        for lemma, inflection, _, inflection_interval in morph_table_data
+    ]
 
 
 def _get_learning_intervals_of_lemmas(
-    morph_table_data: list[dict[str, Any]]
+    morph_table_data: list[tuple[str, str, int | None, int]]
 ) -> dict[str, int]:
     learning_intervals_of_lemmas: dict[str, int] = {}
 
-    for morph_data_dict in morph_table_data:
-        lemma = morph_data_dict["lemma"]
-        inflection_interval = morph_data_dict["highest_inflection_learning_interval"]
-
+    for lemma, _inflection, _, inflection_interval in morph_table_data:
         if lemma in learning_intervals_of_lemmas:
             if inflection_interval > learning_intervals_of_lemmas[lemma]:
                 learning_intervals_of_lemmas[lemma] = inflection_interval
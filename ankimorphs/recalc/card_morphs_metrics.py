@@ -1,3 +1,5 @@
+import operator
+
 from ..ankimorphs_config import AnkiMorphsConfig
 from ..morpheme import Morpheme
 
@@ -50,23 +52,29 @@ class CardMorphsMetrics:  # pylint:disable=too-many-instance-attributes
         morph_priorities: dict[tuple[str, str], int],
     ) -> None:
         default_morph_priority = len(morph_priorities) + 1
-        learning_interval_attribute: str
-        sub_key_attribute: str
 
+        # this runs for every morph on every card, so the attribute getters and
+        # config values are hoisted out of the loop instead of being resolved
+        # from strings on each iteration
         if am_config.evaluate_morph_inflection:
-            learning_interval_attribute = "highest_inflection_learning_interval"
-            sub_key_attribute = "inflection"
+            get_learning_interval = operator.attrgetter(
+                "highest_inflection_learning_interval"
+            )
+            get_sub_key = operator.attrgetter("inflection")
         else:
-            learning_interval_attribute = "highest_lemma_learning_interval"
-            sub_key_attribute = "lemma"
+            get_learning_interval = operator.attrgetter(
+                "highest_lemma_learning_interval"
+            )
+            get_sub_key = operator.attrgetter("lemma")
 
+        interval_for_known_morphs = am_config.interval_for_known_morphs
         hp = 0
 
         for morph in self.all_morphs:
-            learning_interval = getattr(morph, learning_interval_attribute)
+            learning_interval = get_learning_interval(morph)
             assert learning_interval is not None
 
-            sub_key = getattr(morph, sub_key_attribute)
+            sub_key = get_sub_key(morph)
             assert sub_key is not None
 
             # this is a composite key consisting of either:
@@ -74,20 +82,19 @@ class CardMorphsMetrics:  # pylint:disable=too-many-instance-attributes
             # - (morph.lemma, morph.inflection)
             key = (morph.lemma.lower(), sub_key.lower())
 
-            if key in morph_priorities:
-                morph_priority = morph_priorities[key]
-                if morph_priority > hp:
-                    hp = morph_priority
-            else:
+            morph_priority = morph_priorities.get(key)
+            if morph_priority is None:
                 morph_priority = default_morph_priority
                 self.non_priorities.append(morph)
+            elif morph_priority > hp:
+                hp = morph_priority
 
             self.total_priority_all_morphs += morph_priority
 
             if learning_interval == 0:
                 self.unknown_morphs.append(morph)
                 self.total_priority_unknown_morphs += morph_priority
-            elif learning_interval < am_config.interval_for_known_morphs:
+            elif learning_interval < interval_for_known_morphs:
                 self.num_learning_morphs += 1
                 self.total_priority_learning_morphs += morph_priority
 
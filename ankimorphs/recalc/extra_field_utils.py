@@ -121,15 +121,9 @@ def _get_string_of_morphs(
     am_config: AnkiMorphsConfig,
     morphs: list[Morpheme],
 ) -> str:
-    morphs_string: str
-
     if am_config.extra_fields_display_inflections:
-        morphs_string = "".join(f"{morph.inflection}, " for morph in morphs)
-    else:
-        morphs_string = "".join(f"{unknown.lemma}, " for unknown in morphs)
-
-    morphs_string = morphs_string[:-2]  # removes last comma and whitespace
-    return morphs_string
+        return ", ".join(morph.inflection for morph in morphs)
+    return ", ".join(unknown.lemma for unknown in morphs)
 
 
 def update_unknown_morphs_count_field(
@@ -6,7 +6,7 @@ from pathlib import Path
 from anki.cards import Card
 from anki.consts import CARD_TYPE_NEW
 from anki.models import FieldDict, ModelManager, NotetypeDict
-from anki.notes import Note
+from anki.notes import Note, NoteId
 from aqt import mw
 from aqt.operations import QueryOp
 from aqt.utils import tooltip
@@ -38,6 +38,12 @@ from .anki_data_utils import AnkiMorphsCardData
 from .card_morphs_metrics import CardMorphsMetrics
 from .card_score import _DEFAULT_SCORE, CardScore
 
+_recalc_in_progress: bool = False
+
+# cards and notes are written back in chunks of this size to keep the
+# individual transactions from growing unboundedly on huge collections
+_UPDATE_CHUNK_SIZE: int = 10_000
+
 
 def recalc() -> None:
     ################################################################
@@ -50,8 +56,15 @@ def recalc() -> None:
     # QueryOp docs:
     # https://addon-docs.ankiweb.net/background-ops.html
     ################################################################
+    global _recalc_in_progress
     assert mw is not None
 
+    if _recalc_in_progress:
+        # triggering recalc again (toolbar link, shortcut, sync hook)
+        # while one is running would make the runs race on the database
+        tooltip("Recalc is already running", parent=mw)
+        return
+
     read_enabled_config_filters: list[AnkiMorphsConfigFilter] = (
         ankimorphs_config.get_read_enabled_filters()
     )
@@ -76,6 +89,7 @@ def recalc() -> None:
             return
 
     mw.progress.start(label="Recalculating")
+    _recalc_in_progress = True
     _start_time: float = time.time()
 
     # lambda is used to ignore the irrelevant arguments given by QueryOp
@@ -170,7 +184,10 @@ def _update_cards_and_notes(  # pylint:disable=too-many-locals, too-many-stateme
     card_morph_map_cache: dict[int, list[Morpheme]] = am_db.get_card_morph_map_cache()
     handled_cards: dict[int, None] = {}  # we only care about the key lookup, not values
     modified_cards: dict[int, Card] = {}  # a dict makes the offsetting process easier
-    modified_notes: list[Note] = []
+    # cards that share a note would otherwise add the same note multiple times;
+    # keeping the latest version per note id matches the update_notes semantics
+    # of the previous list (last write wins) while writing each note only once
+    modified_notes: dict[NoteId, Note] = {}
 
     # clear the morph collection frequency cache between recalcs
     am_db.get_morph_priorities_from_collection.cache_clear()
@@ -192,6 +209,11 @@ def _update_cards_and_notes(  # pylint:disable=too-many-locals, too-many-stateme
         )
         card_amount = len(cards_data_dict)
 
+        # unlike the other extra fields, the 'non-priorities' field has no
+        # config toggle, so we check its presence once per note filter here
+        # instead of paying for the field update on every new card
+        has_non_priorities_field: bool = "non-priorities" in field_name_dict
+
         for counter, card_id in enumerate(cards_data_dict):
             progress_utils.background_update_progress_potentially_cancel(
                 label=f"Updating {config_filter.note_type} cards<br>card: {counter} of {card_amount}",
@@ -247,12 +269,13 @@ def _update_cards_and_notes(  # pylint:disable=too-many-locals, too-many-stateme
                         note=note,
                         all_morphs=cards_morph_metrics.all_morphs,
                     )
-                extra_field_utils.update_non_priorities_field(
-                    am_config=am_config,
-                    field_name_dict=field_name_dict,
-                    note=note,
-                    all_morphs=cards_morph_metrics.non_priorities,
-                )
+                if has_non_priorities_field:
+                    extra_field_utils.update_non_priorities_field(
+                        am_config=am_config,
+                        field_name_dict=field_name_dict,
+                        note=note,
+                        all_morphs=cards_morph_metrics.non_priorities,
+                    )
                 if config_filter.extra_all_morphs_count:
                     extra_field_utils.update_all_morphs_count_field(
                         field_name_dict=field_name_dict,
@@ -309,7 +332,7 @@ def _update_cards_and_notes(  # pylint:disable=too-many-locals, too-many-stateme
                 modified_cards[card_id] = card
 
             if original_fields != note.fields or original_tags != note.tags:
-                modified_notes.append(note)
+                modified_notes[note.id] = note
 
             handled_cards[card_id] = None  # this marks the card as handled
 
@@ -324,8 +347,20 @@ def _update_cards_and_notes(  # pylint:disable=too-many-locals, too-many-stateme
         )
 
     progress_utils.background_update_progress(label="Inserting into Anki collection")
-    mw.col.update_cards(list(modified_cards.values()))
-    mw.col.update_notes(modified_notes)
+
+    # the cards cannot be flushed any earlier than this because the
+    # offsetting process above needs the complete set of modified cards
+    modified_cards_list = list(modified_cards.values())
+    modified_notes_list = list(modified_notes.values())
+
+    for chunk_start in range(0, len(modified_cards_list), _UPDATE_CHUNK_SIZE):
+        mw.col.update_cards(
+            modified_cards_list[chunk_start : chunk_start + _UPDATE_CHUNK_SIZE]
+        )
+    for chunk_start in range(0, len(modified_notes_list), _UPDATE_CHUNK_SIZE):
+        mw.col.update_notes(
+            modified_notes_list[chunk_start : chunk_start + _UPDATE_CHUNK_SIZE]
+        )
 
 
 def _add_offsets_to_new_cards(
@@ -442,9 +477,12 @@ def _apply_offsets(
 
 def _on_success(_start_time: float) -> None:
     # This function runs on the main thread.
+    global _recalc_in_progress
     assert mw is not None
     assert mw.progress is not None
 
+    _recalc_in_progress = False
+
     mw.toolbar.draw()  # updates stats
     mw.progress.finish()
 
@@ -468,10 +506,12 @@ def _on_failure(  # pylint:disable=too-many-branches
     before_query_op: bool = False,
 ) -> None:
     # This function runs on the main thread.
+    global _recalc_in_progress
     assert mw is not None
     assert mw.progress is not None
 
     if not before_query_op:
+        _recalc_in_progress = False
         mw.progress.finish()
 
     if isinstance(error, CancelledOperationException):
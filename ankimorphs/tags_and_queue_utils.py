@@ -40,19 +40,24 @@ def update_tags_and_queue_of_new_cards(
         am_config.tag_known_automatically,
     ]
 
+    # membership tests on the tag list are linear scans, so we test against
+    # a set snapshot instead; every tag is tested before it is mutated, so
+    # the snapshot never goes stale. The list itself keeps the tag order.
+    note_tags: set[str] = set(note.tags)
+
     if has_learning_morphs:
-        if am_config.tag_fresh not in note.tags:
+        if am_config.tag_fresh not in note_tags:
             note.tags.append(am_config.tag_fresh)
     else:
-        if am_config.tag_fresh in note.tags:
+        if am_config.tag_fresh in note_tags:
             note.tags.remove(am_config.tag_fresh)
 
     if unknowns == 0:
         if am_config.recalc_suspend_known_new_cards and card.queue != suspended:
             card.queue = suspended
-        if am_config.tag_known_manually in note.tags:
+        if am_config.tag_known_manually in note_tags:
             remove_exclusive_tags(note, mutually_exclusive_tags)
-        elif am_config.tag_known_automatically not in note.tags:
+        elif am_config.tag_known_automatically not in note_tags:
             remove_exclusive_tags(note, mutually_exclusive_tags)
             # if a card has any learning morphs, then we don't want to
             # give it a 'known' tag because that would automatically
@@ -60,11 +65,11 @@ def update_tags_and_queue_of_new_cards(
             if not has_learning_morphs:
                 note.tags.append(am_config.tag_known_automatically)
     elif unknowns == 1:
-        if am_config.tag_ready not in note.tags:
+        if am_config.tag_ready not in note_tags:
             remove_exclusive_tags(note, mutually_exclusive_tags)
             note.tags.append(am_config.tag_ready)
     else:
-        if am_config.tag_not_ready not in note.tags:
+        if am_config.tag_not_ready not in note_tags:
             remove_exclusive_tags(note, mutually_exclusive_tags)
             note.tags.append(am_config.tag_not_ready)
     remove_exclusive_tags(note, ["non_priorities", ])
@@ -73,9 +78,10 @@ def update_tags_and_queue_of_new_cards(
 
 
 def remove_exclusive_tags(note: Note, mutually_exclusive_tags: list[str]) -> None:
-    for tag in mutually_exclusive_tags:
-        if tag in note.tags:
-            note.tags.remove(tag)
+    # one rebuild of the list beats one linear scan per excluded tag
+    exclusive_tags = set(mutually_exclusive_tags)
+    if not exclusive_tags.isdisjoint(note.tags):
+        note.tags = [tag for tag in note.tags if tag not in exclusive_tags]
 
 
 def update_tags_of_review_cards(
@@ -129,7 +135,6 @@ def _reset_am_tags_background_op() -> None:
                 label=f"Removing {tag} tag from notes<br>note: {counter} of {note_amount}",
                 counter=counter,
                 max_value=note_amount,
-                increment=100,
             )
             note: Note = modified_notes.get(note_id, mw.col.get_note(note_id))
             note.tags.remove(tag)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import re
 
 from . import text_preprocessing
@@ -7,6 +8,13 @@ from .ankimorphs_config import AnkiMorphsConfig
 from .morpheme import Morpheme
 
 
+@functools.lru_cache(maxsize=131072)
+def _get_inflection_regex(inflection: str) -> re.Pattern[str]:
+    # escaping special regex characters is crucial because morphs from malformed text
+    # sometimes can include them, e.g. "?몇"
+    return re.compile(re.escape(inflection), flags=re.IGNORECASE)
+
+
 class SpanElement:
 
     def __init__(
@@ -170,8 +178,12 @@ def _extract_span_elements_and_filter_string(
 ) -> tuple[list[SpanElement], str]:
     span_elements: list[SpanElement] = []
 
+    if len(card_morphs) == 0:
+        return span_elements, text_to_highlight
+
     # To avoid formatting a smaller morph contained in a bigger morph, we reverse sort
-    # the morphs based on length and extract those first.
+    # the morphs based on length and extract those first; replacing the found matches
+    # with whitespace prevents the smaller morphs from matching inside them.
     morphs_by_size = sorted(
         card_morphs,
         key=lambda _simple_morph: len(_simple_morph.inflection),
@@ -179,34 +191,17 @@ def _extract_span_elements_and_filter_string(
     )
 
     for morph in morphs_by_size:
-        # print(f"morph: {morph.lemma}, {morph.inflection}")
-        learning_interval: int
-
-        if am_config.evaluate_morph_inflection:
-            learning_interval = getattr(morph, "highest_inflection_learning_interval")
-        else:
-            learning_interval = getattr(morph, "highest_lemma_learning_interval")
-
-        assert learning_interval is not None
-
-        if learning_interval == 0:
-            morph_status = "unknown"
-        elif learning_interval < am_config.interval_for_known_morphs:
-            morph_status = "learning"
-        else:
-            morph_status = "known"
-
-        # escaping special regex characters is crucial because morphs from malformed text
-        # sometimes can include them, e.g. "?몇"
-        regex_pattern: str = f"{re.escape(morph.inflection)}"
-        morph_matches = re.finditer(
-            regex_pattern, text_to_highlight, flags=re.IGNORECASE
+        morph_status: str = _get_morph_status(am_config, morph)
+        morph_matches = _get_inflection_regex(morph.inflection).finditer(
+            text_to_highlight
         )
 
+        filtered_parts: list[str] = []
+        previous_end_index: int = 0
+
         for morph_match in morph_matches:
             start_index = morph_match.start()
             end_index = morph_match.end()
-            morph_len = end_index - start_index
 
             # the morph_match.group() maintains the original letter casing of the
             # morph found in the text, which is crucial because we want everything
@@ -216,15 +211,34 @@ def _extract_span_elements_and_filter_string(
             )
 
             # we need to preserve indices, so we replace the morphs with whitespaces
-            text_to_highlight = (
-                text_to_highlight[:start_index]
-                + "".join([" " for _ in range(morph_len)])
-                + text_to_highlight[end_index:]
-            )
+            filtered_parts.append(text_to_highlight[previous_end_index:start_index])
+            filtered_parts.append(" " * (end_index - start_index))
+            previous_end_index = end_index
+
+        if previous_end_index > 0:
+            filtered_parts.append(text_to_highlight[previous_end_index:])
+            text_to_highlight = "".join(filtered_parts)
 
     return span_elements, text_to_highlight
 
 
+def _get_morph_status(am_config: AnkiMorphsConfig, morph: Morpheme) -> str:
+    learning_interval: int
+
+    if am_config.evaluate_morph_inflection:
+        learning_interval = getattr(morph, "highest_inflection_learning_interval")
+    else:
+        learning_interval = getattr(morph, "highest_lemma_learning_interval")
+
+    assert learning_interval is not None
+
+    if learning_interval == 0:
+        return "unknown"
+    if learning_interval < am_config.interval_for_known_morphs:
+        return "learning"
+    return "known"
+
+
 def _get_span_element(
     span_elements: list[SpanElement], previous_span_index: int
 ) -> SpanElement | None: